@@ -1,10 +1,16 @@
 import logging
 
-logging.basicConfig(
-    level=logging.INFO, 
-    format='greengraph | %(levelname)s | %(message)s',
-    handlers=[logging.StreamHandler()]  # Output to console
-)
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+def configure_logging(level=logging.INFO):
+    """Configures console logging for applications using greengraph."""
+    logging.basicConfig(
+        level=level,
+        format='greengraph | %(levelname)s | %(message)s',
+        handlers=[logging.StreamHandler()]  # Output to console
+    )
 
 __version__ = "0.0.0"
 
@@ -19,18 +25,18 @@ def remove_cache_dir():
     if APP_CACHE_BASE_DIR.exists():
         try:
             shutil.rmtree(APP_CACHE_BASE_DIR)
-            logging.info(f"Cache directory {APP_CACHE_BASE_DIR} removed successfully.")
+            logger.info("Cache directory %s removed successfully.", APP_CACHE_BASE_DIR)
         except OSError as e:
-            logging.error(f"Error removing cache directory {APP_CACHE_BASE_DIR}: {e}")
+            logger.error("Error removing cache directory %s: %s", APP_CACHE_BASE_DIR, e)
     else:
-        logging.info(f"Cache directory {APP_CACHE_BASE_DIR} does not exist. Nothing to remove.")
+        logger.info("Cache directory %s does not exist. Nothing to remove.", APP_CACHE_BASE_DIR)
 
 
 def cache_dir_path():
     """Returns the path to the application cache directory."""
     if not APP_CACHE_BASE_DIR.exists():
-        logging.info(f"No cache directory exists. This directory is created only by some download functions.")
+        logger.info("No cache directory exists. This directory is created only by some download functions.")
         return None
     else:
-        logging.info(f"Cache directory located at: {APP_CACHE_BASE_DIR}.")
-        return APP_CACHE_BASE_DIR
\ No newline at end of file
+        logger.info("Cache directory located at: %s.", APP_CACHE_BASE_DIR)
+        return APP_CACHE_BASE_DIR